@@ -1,22 +1,41 @@
 import sys
 
-from multiclipboard import Clipboard
+from multiclipboard import Clipboard, _read_label
 
 SAVED_DATA = "clipboard.json"
 
 
 def main():
-    if len(sys.argv) > 2:
-        print("Please pass exactly one command.")
-        return
-
     my_clipboard = Clipboard(SAVED_DATA)
 
-    if len(sys.argv) == 1:
-        print(my_clipboard)
-    else:
-        command: str = sys.argv[1]
-        my_clipboard.clipboard(command)
+    # one match on the argv tuple parses and dispatches in a single step,
+    # going straight to the helpers instead of re-matching inside clipboard()
+    match sys.argv[1:]:
+        case []:
+            print(my_clipboard)
+
+        case ["save"] | ["save", _] as args:
+            label: str = args[1] if len(args) == 2 else None
+            my_clipboard._save_data(label=label)
+
+        case ["load"] | ["load", _] as args:
+            label: str = (
+                args[1]
+                if len(args) == 2
+                else _read_label("Enter label to retrieve data: ")
+            )
+            my_clipboard._load_data(
+                my_clipboard._load_data_from_clipboard(), label=label
+            )
+
+        case ["list"]:
+            my_clipboard._load_data(my_clipboard._load_data_from_clipboard())
+
+        case ["clear"] | ["delete"]:
+            my_clipboard._delete_clipboard()
+
+        case _:
+            print("Unknown command.")
 
 
 if __name__ == "__main__":
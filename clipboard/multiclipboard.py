@@ -4,10 +4,36 @@
 """
 
 import json
+import mmap
+import os
 import pathlib
+import sys
 
-# pip install pyperclip
-import pyperclip
+# pip install orjson - C-extension JSON, ~2-8x faster than stdlib
+# falls back to stdlib json if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# in-process parse cache: filename -> (mtime_ns, size, parsed cache dict)
+# repeated loads skip the JSON parse entirely while the file is unchanged
+_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def _read_label(prompt: str) -> str:
+    """
+    _read_label reads a label from standard input, prompting only on a TTY
+    so piped/scripted invocations are not polluted with prompt text
+
+    Args:
+        prompt (str): message shown when stdin is an interactive terminal
+
+    Returns:
+        str: the label entered by the user
+    """
+
+    return input(prompt if sys.stdin.isatty() else "")
 
 
 class Clipboard:
@@ -44,8 +70,17 @@ class Clipboard:
             data (dict): actual clipboard cache as a dictionary
         """
 
-        with open(file=self.filename, mode="w") as c_board:
-            json.dump(data, c_board)
+        payload: bytes = (
+            orjson.dumps(data) if orjson else json.dumps(data).encode()
+        )
+        # write to a sibling temp file and rename it into place so a crash
+        # mid-write can never leave a truncated/corrupt clipboard cache
+        # (os.replace is atomic on both POSIX and Windows)
+        tmp_filename: str = f"{self.filename}.tmp"
+        with open(file=tmp_filename, mode="wb") as c_board:
+            c_board.write(payload)
+        os.replace(tmp_filename, self.filename)
+        _CACHE.pop(self.filename, None)
 
     def _load_data_from_clipboard(self, key: str = None) -> dict:
         """
@@ -59,28 +94,93 @@ class Clipboard:
         """
 
         try:
-            with open(file=self.filename, mode="r") as c_board:
-                data: dict = json.load(c_board)
+            stats = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+
+        cached = _CACHE.get(self.filename)
+        if (
+            cached is not None
+            and cached[0] == stats.st_mtime_ns
+            and cached[1] == stats.st_size
+        ):
+            data: dict = cached[2]
+            return data if key is None else data.get(key)
+
+        try:
+            with open(file=self.filename, mode="rb") as c_board:
+                try:
+                    # map the cache instead of reading it - hands the parser a
+                    # zero-copy view of the kernel page cache
+                    with mmap.mmap(
+                        c_board.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        data: dict = (
+                            orjson.loads(memoryview(mapped))
+                            if orjson
+                            else json.loads(mapped[:])
+                        )
+                except ValueError:
+                    # empty files cannot be mapped - fall back to a plain read
+                    raw: bytes = c_board.read()
+                    data: dict = orjson.loads(raw) if orjson else json.loads(raw)
         except FileNotFoundError:
             return None
         else:
+            _CACHE[self.filename] = (stats.st_mtime_ns, stats.st_size, data)
             return data if key is None else data.get(key)
 
-    def _save_data(self, current_clipboard: dict) -> None:
+    def _update_clipboard(self, mutator) -> bool:
+        """
+        _update_clipboard applies one read-modify-write cycle to the clipboard cache
+
+        Loads the cache once (served from the parse cache when warm), lets the
+        mutator edit the dict in place, then writes the result back atomically
+
+        Args:
+            mutator (Callable[[dict], bool | None]): edits the cache dict in place; may return False to skip the write
+
+        Returns:
+            bool: True if the cache was rewritten, False if the mutator declined
+        """
+
+        data: dict = self._load_data_from_clipboard() or {}
+
+        if mutator(data) is False:
+            return False
+
+        self._save_data_to_clipboard(data=data)
+        return True
+
+    def _save_data(self, label: str = None) -> None:
         """
         _save_data handles saving logic - takes in user input and directs it to file cache
 
         Args:
-            current_clipboard (dict): current state of the clipboard cache
+            label (str, optional): label to save under, prompted for if not given. Defaults to None.
         """
 
-        if not current_clipboard:
-            current_clipboard = {}
+        # deferred so list/clear/delete never pay pyperclip's import cost
+        # pip install pyperclip
+        import pyperclip
+
+        key: str = (
+            label
+            if label is not None
+            else _read_label("Enter a label for copied data: ")
+        )
+        new_value: str = pyperclip.paste()
+
+        def set_label(data: dict):
+            # skip the re-encode and rewrite when the save is a no-op
+            if data.get(key) == new_value:
+                return False
+            data[key] = new_value
 
-        key: str = input("Enter a label for copied data: ")
-        current_clipboard[key] = pyperclip.paste()
-        self._save_data_to_clipboard(data=current_clipboard)
-        print("data saved!")
+        if self._update_clipboard(set_label):
+            print("data saved!")
+        else:
+            print("no change - data already saved under that label.")
 
     def _load_data(self, current_clipboard, label: str = None) -> dict:
         """
@@ -104,6 +204,9 @@ class Clipboard:
                     "label does not exist. use <list> command to see current clipboard contents."
                 )
             else:
+                # deferred - see _save_data
+                import pyperclip
+
                 pyperclip.copy(retrieved_data)
                 print("data copied to clipboard!")
         else:
@@ -116,27 +219,31 @@ class Clipboard:
 
         clipboard_path = pathlib.Path(self.filename)
         clipboard_path.unlink(missing_ok=True)
+        _CACHE.pop(self.filename, None)
 
-    def clipboard(self, command: str):
+    def clipboard(self, command: str, label: str = None):
         """
         clipboard is the main clipboard - handles all clipboard logic and directs control flow accordingly
 
         Args:
             command (str): user's input command that prompts a given action
+            label (str, optional): label argument for save/load, prompted for if not given. Defaults to None.
         """
 
-        current_clipboard: dict = self._load_data_from_clipboard()
-
         match command:
             case "save":
-                self._save_data(current_clipboard)
+                self._save_data(label=label)
 
             case "load":
-                key: str = input("Enter label to retrieve data: ")
-                self._(current_clipboard, label=key)
+                key: str = (
+                    label
+                    if label is not None
+                    else _read_label("Enter label to retrieve data: ")
+                )
+                self._load_data(self._load_data_from_clipboard(), label=key)
 
             case "list":
-                self._(current_clipboard)
+                self._load_data(self._load_data_from_clipboard())
 
             case "clear" | "delete":
                 self._delete_clipboard()
@@ -1,14 +1,22 @@
-import gc
+import errno
 import json
 import os
 import pathlib
 import re
 import shutil
 import sys
-from subprocess import PIPE, run
-
-DIR_PATTERN = "*[g|G][a|A][m|M][e|E]*"
-FILE_EXTENSION = "*.go"
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import DEVNULL, run
+
+# pip install orjson - C-extension JSON, ~2-8x faster than stdlib
+# falls back to stdlib json if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DIR_SUBSTRING = "game"
+FILE_EXTENSION = ".go"
 COMPILE_COMMAND = ["go", "build"]
 
 
@@ -23,7 +31,9 @@ def get_absolute_path(dir_file: str) -> pathlib.Path:
         pathlib.Path: absolute path
     """
 
-    return pathlib.Path(dir_file).resolve(dir_file)
+    # os.path.abspath is a plain string operation - no Path allocations, and
+    # no accidentally passing dir_file as resolve()'s strict flag
+    return pathlib.Path(os.path.abspath(dir_file))
 
 
 def find_all_game_paths(source_dir: pathlib.Path) -> list[pathlib.Path]:
@@ -37,14 +47,16 @@ def find_all_game_paths(source_dir: pathlib.Path) -> list[pathlib.Path]:
         list[pathlib.Path]: list of found game directories
     """
 
-    # os.walk() - recursive
+    # os.scandir() hands back DirEntry objects whose is_dir() answers from
+    # the readdir cache, so no extra stat() per entry
     # if statement ensures return of only directories containing 'game', not files
-    return [
-        item
-        for item in source_dir.glob(DIR_PATTERN)
-        # .rglob() for recursive search
-        if item.is_dir()
-    ]
+    with os.scandir(source_dir) as entries:
+        return [
+            pathlib.Path(entry.path)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and DIR_SUBSTRING in entry.name.lower()
+        ]
 
 
 def setup_target_dir(dirname: str) -> pathlib.Path:
@@ -63,6 +75,24 @@ def setup_target_dir(dirname: str) -> pathlib.Path:
     return get_absolute_path(dirname)
 
 
+def _strip_ci(name: str, needle: str) -> str:
+    """
+    _strip_ci removes the first case-insensitive occurrence of a literal substring
+
+    Args:
+        name (str): string to strip
+        needle (str): lowercase substring to remove
+
+    Returns:
+        str: name with the first occurrence sliced out, unchanged if absent
+    """
+
+    index: int = name.lower().find(needle)
+    if index < 0:
+        return name
+    return name[:index] + name[index + len(needle):]
+
+
 def get_names_from_paths(
     paths: list[pathlib.Path], to_strip: str
 ) -> list[str]:
@@ -77,21 +107,102 @@ def get_names_from_paths(
         list[str]: list of new directory names
     """
 
-    new_names = []
-    for path in paths:
-        # os.path.split()
-        dirname: str = path.name
-        # using regex to find case-insensitive matches of the to_strip string
-        # (assumes there is only one match per string)
-        new_dirname = dirname.replace(
-            re.findall(to_strip, dirname, flags=re.IGNORECASE)[0], ""
-        )
-        new_names.append(new_dirname)
+    # literal needles (the only real caller passes "game") take a plain
+    # lowercase-find-and-slice path - no regex engine in the loop, and names
+    # without a match pass through unchanged instead of raising
+    if re.escape(to_strip) == to_strip:
+        needle: str = to_strip.lower()
+        return [_strip_ci(path.name, needle) for path in paths]
+
+    # compile the pattern once instead of per directory; sub() removes the
+    # first case-insensitive match in a single pass
+    # (assumes there is only one match per string)
+    pattern = re.compile(to_strip, flags=re.IGNORECASE)
+    return [pattern.sub("", path.name, count=1) for path in paths]
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    _fast_copy copies one file's bytes entirely in kernel space
+
+    os.copy_file_range moves data without ever surfacing it into a
+    user-space buffer; falls back to shutil.copyfile where the call is
+    unavailable or the kernel refuses it (e.g. cross-device copies)
 
-    return new_names
+    Args:
+        src (str): source file path
+        dst (str): destination file path
+    """
 
+    if os.path.exists(dst):
+        # never truncate dst when it IS src - e.g. a hardlink left behind by
+        # an earlier "link"-mode run - or the source data is destroyed
+        if os.path.samefile(src, dst):
+            return
+        # unlink rather than truncate in place, so overwriting a hardlinked
+        # dst cannot write through to whatever else shares the inode
+        os.unlink(dst)
+
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            src_fd = src_file.fileno()
+            dst_fd = dst_file.fileno()
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as error:
+        if error.errno not in (
+            errno.EXDEV,
+            errno.EOPNOTSUPP,
+            errno.ENOSYS,
+            errno.EINVAL,
+        ):
+            raise
+        # the kernel cannot copy this pair (cross-device on kernels >= 5.19,
+        # or copy_file_range unsupported) - redo the file in user space;
+        # copyfile reopens dst "wb", so the truncated failed attempt is fine
+        shutil.copyfile(src, dst)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    _link_or_copy hardlinks one file over dst, byte-copying only on failure
 
-def copy_and_overwrite(source: pathlib.Path, dest: str) -> None:
+    Args:
+        src (str): source file path
+        dst (str): destination file path
+    """
+
+    if os.path.exists(dst):
+        # dst already linked to src - nothing to do
+        if os.path.samefile(src, dst):
+            return
+        # real overwrite semantics: os.link refuses existing targets
+        os.unlink(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        # cross-device link (EXDEV) or a filesystem without hardlinks (EPERM)
+        # - fall back to a byte copy for this file only; _fast_copy itself
+        # ends in user-space shutil.copyfile when the kernel cannot copy
+        # across devices either
+        _fast_copy(src, dst)
+
+
+# per-file copy strategies for copy_and_overwrite; "link" and "fast" skip
+# copystat entirely (no utime/chmod per file), which staging dirs never need
+_COPY_FUNCTIONS = {"link": _link_or_copy, "fast": _fast_copy, "copy": shutil.copy2}
+
+
+def copy_and_overwrite(source: pathlib.Path, dest: str, mode: str = "link") -> None:
     """
     copy_and_overwrite recursively copies old directories into a new location,
     with overwrite if they already exist
@@ -99,9 +210,19 @@ def copy_and_overwrite(source: pathlib.Path, dest: str) -> None:
     Args:
         source (pathlib.Path): directory to recursively copy
         dest (str): new directory location
+        mode (str, optional): "link" hardlinks files where possible, "fast" does
+            in-kernel byte copies, "copy" is a full copy with metadata. Defaults to "link".
     """
 
-    _ = shutil.copytree(src=source, dst=dest, dirs_exist_ok=True)
+    # the copy_function handles its own per-file fallback, so one odd file
+    # never triggers a redundant second pass over the whole tree
+    _ = shutil.copytree(
+        src=source,
+        dst=dest,
+        dirs_exist_ok=True,
+        copy_function=_COPY_FUNCTIONS[mode],
+        ignore_dangling_symlinks=True,
+    )
 
 
 def create_new_dirs(
@@ -118,10 +239,23 @@ def create_new_dirs(
         new_dirs (list[str]): new directory names
     """
 
-    for src_path, new_dir in zip(old_dirs, new_dirs):
-        # os.path.join()
-        dest_path = pathlib.Path.joinpath(new_dirpath, new_dir)
-        copy_and_overwrite(source=src_path, dest=dest_path)
+    if not old_dirs:
+        return
+
+    # directory copies are I/O-bound, so threads overlap the syscalls well
+    with ThreadPoolExecutor(max_workers=min(32, len(old_dirs))) as executor:
+        futures = [
+            executor.submit(
+                copy_and_overwrite,
+                source=src_path,
+                # plain string join - Path objects only at the API boundary
+                dest=os.path.join(str(new_dirpath), new_dir),
+            )
+            for src_path, new_dir in zip(old_dirs, new_dirs)
+        ]
+        # consume the futures so a failed copy raises instead of vanishing
+        for future in futures:
+            future.result()
 
 
 def make_json_metadata_file(path: pathlib.Path, dirs: list[str]) -> None:
@@ -133,12 +267,21 @@ def make_json_metadata_file(path: pathlib.Path, dirs: list[str]) -> None:
         dirs (list[str]): some metadata
     """
 
-    data = {"game_names": dirs, "number_of_games": len(dirs)}
     json_path = path.joinpath("metadata.json")
+    encode = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode())
 
+    # stream the document one element at a time through the buffered file
+    # object, so peak memory stays flat however many games were found
     # pathlib.Path().open() works like builtin open() function
-    with json_path.open(mode="w") as metadata_file:
-        json.dump(data, metadata_file)
+    with json_path.open(mode="wb") as metadata_file:
+        metadata_file.write(b'{"game_names":[')
+        for index, name in enumerate(dirs):
+            if index:
+                metadata_file.write(b",")
+            metadata_file.write(encode(name))
+        metadata_file.write(b'],"number_of_games":')
+        metadata_file.write(str(len(dirs)).encode())
+        metadata_file.write(b"}")
 
 
 def compile_code_files(path: pathlib.Path):
@@ -149,13 +292,37 @@ def compile_code_files(path: pathlib.Path):
         path (pathlib.Path): directory containing files to compile
     """
 
-    for file in path.rglob(FILE_EXTENSION):
-        cwd = pathlib.Path().absolute()
-        os.chdir(file.parent)
-        command = COMPILE_COMMAND + [file.name]
-        gc.collect()
-        run(command, stdin=PIPE, stdout=PIPE, universal_newlines=True)
-        os.chdir(cwd)
+    # os.walk + a suffix test walks the tree with one scandir per directory,
+    # where rglob would allocate and re-stat a Path per entry
+    tasks = [
+        (root, COMPILE_COMMAND + [name])
+        for root, _, files in os.walk(path)
+        for name in files
+        if name.endswith(FILE_EXTENSION)
+    ]
+
+    # each `go build` runs in its own process and subprocess.run releases the
+    # GIL while waiting, so threads give near-linear speedup across cores;
+    # cwd= replaces the (process-global, parallel-unsafe) os.chdir dance
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            # DEVNULL, not PIPE: the output is never read, and an unread
+            # pipe can fill up and block the compiler; check=True turns a
+            # nonzero exit into CalledProcessError instead of silence
+            executor.submit(
+                run,
+                command,
+                stdin=DEVNULL,
+                stdout=DEVNULL,
+                stderr=DEVNULL,
+                cwd=cwd,
+                check=True,
+            )
+            for cwd, command in tasks
+        ]
+        # consume the futures so a missing compiler or failed build raises
+        for future in futures:
+            future.result()
 
 
 def main(args: list):